@@ -3,55 +3,220 @@
 日本の主要銘柄の株価データを取得・分析し、投資判断をサポートするStreamlitアプリ
 """
 
+import math
+import time
+
 import streamlit as st
 import yfinance as yf
+import yfinance_cache as yfc
+from yfinance_cache import yfc_cache_manager
 import pandas as pd
 
-# 銘柄コード辞書
-STOCK_SYMBOLS = {
+try:
+    # bottleneckがあれば事前コンパイル済みのCカーネルを使う（初回のJITコンパイル待ちがない）
+    from bottleneck import move_mean
+except ImportError:
+    from numbagg import move_mean
+
+from tools.cache import FileCache
+
+# yfinance-cacheの保存先（再起動後も差分取得のみで済むようにディスクに保持）
+yfc_cache_manager.SetCacheDirpath(".yfc_cache")
+
+# 一括取得した株価データのファイルキャッシュ（再起動・セッションをまたいで24時間有効）
+STOCK_CACHE = FileCache(".cache", ttl_seconds=86400)
+
+# 銘柄一覧 (銘柄コード, 会社名, 5万円以下で100株購入可能か)
+STOCK_SYMBOLS = [
     # 5万円以下で100株購入可能な銘柄
-    "1301.T": "極洋",
-    "4004.T": "昭和電工",
-    "7270.T": "富士通テン",
-    "9439.T": "東京通信グループ",
-    "8410.T": "セブン銀行",
-    # 主要銘柄（参考用）
-    "7203.T": "トヨタ自動車",
-    "8306.T": "三菱UFJフィナンシャル・グループ",
-    "9984.T": "ソフトバンクグループ",
-    "6758.T": "ソニーグループ",
-    "9433.T": "KDDI",
-    "9434.T": "ソフトバンク"
+    ("1301.T", "極洋", True),
+    ("4004.T", "昭和電工", True),
+    ("7270.T", "富士通テン", True),
+    ("9439.T", "東京通信グループ", True),
+    ("8410.T", "セブン銀行", True),
+    ("9434.T", "ソフトバンク", True),
+    # 主要銘柄（参考用、50,000円超）
+    ("7203.T", "トヨタ自動車", False),
+    ("8306.T", "三菱UFJフィナンシャル・グループ", False),
+    ("9984.T", "ソフトバンクグループ", False),
+    ("6758.T", "ソニーグループ", False),
+    ("9433.T", "KDDI", False)
+]
+
+# 銘柄コード → 会社名
+NAME_BY_CODE = {code: name for code, name, _ in STOCK_SYMBOLS}
+
+# カテゴリ別の銘柄コード
+CODES_BY_CATEGORY = {
+    "affordable": tuple(code for code, _, affordable in STOCK_SYMBOLS if affordable),
+    "premium": tuple(code for code, _, affordable in STOCK_SYMBOLS if not affordable)
 }
 
-@st.cache_data(ttl=3600)  # 1時間キャッシュしてAPI負荷を軽減
+# カテゴリ別のドロップダウン選択肢 (表示ラベル, 銘柄コード)
+# 再実行のたびに作り直さないようモジュール読み込み時に一度だけ作成する
+OPTIONS_BY_CATEGORY = {
+    category: [(f"{code}: {NAME_BY_CODE[code]}", code) for code in codes]
+    for category, codes in CODES_BY_CATEGORY.items()
+}
+
+# カテゴリ別の銘柄コード → 選択肢の位置（ドロップダウンの初期選択に使用）
+INDEX_BY_SYMBOL = {
+    category: {code: i for i, (_, code) in enumerate(options)}
+    for category, options in OPTIONS_BY_CATEGORY.items()
+}
+
+# サイドバーの使い方ガイド (タイトル, 本文)
+HELP_SECTIONS = [
+    ("このアプリについて", """
+日本株の分析と少額投資（5万円以下）の判断をサポートします。
+
+**機能:**
+- 過去1年間の株価チャート
+- 25日移動平均線
+- 100株購入の可否判定
+- トレンド分析
+"""),
+    ("画面の見方", """
+**チャート（左側）**
+- 青線：株価の推移
+- オレンジ線：25日移動平均
+
+**分析情報（右側）**
+- 💰 購入判定：100株の金額
+- ✅/❌：50,000円以下か
+- 📈 トレンド：上昇/下降
+"""),
+    ("判定の見方", """
+**購入判定**
+- ✅ 購入可能：50,000円以下
+- ❌ 予算超過：50,000円超
+
+**トレンド**
+- ↗ 上昇：株価 > 移動平均
+- ↘ 下降：株価 < 移動平均
+"""),
+    ("対応銘柄", """
+**5万円以下で購入可能**
+- 極洋、昭和電工
+- 富士通テン
+- 東京通信グループ
+- セブン銀行
+- ソフトバンク
+
+**主要銘柄（50,000円超）**
+- トヨタ、三菱UFJ
+- ソフトバンクG、ソニーG
+- KDDI
+"""),
+    ("⚠️ 免責事項", """
+**重要な注意事項**
+
+- このアプリは情報提供のみを目的としています
+- 投資助言や推奨ではありません
+- 実際の投資判断は自己責任で行ってください
+- 過去のデータは将来の結果を保証しません
+- 投資にはリスクが伴います
+- データの正確性を保証するものではありません
+- 金融商品取引業の登録はありません
+""")
+]
+
+@st.cache_data(ttl=3600)  # メモリ上に1時間キャッシュ（ネットワークからの再取得はファイルキャッシュにより最大24時間ごと）
+def get_all_stock_data(symbols: tuple, period: str = "1y") -> dict[str, pd.DataFrame]:
+    """
+    複数銘柄の株価データを1回のリクエストでまとめて取得
+    
+    ファイルキャッシュが有効な銘柄はキャッシュから読み込み、
+    それ以外の銘柄のみをダウンロードする
+    
+    Parameters:
+        symbols: 銘柄コードのタプル (例: ("7203.T", "6758.T"))
+        period: 取得期間 (デフォルト: "1y")
+    
+    Returns:
+        銘柄コードをキー、終値(Close)のDataFrameを値とする辞書
+        (取得できなかった銘柄は含まれない)
+    """
+    all_data = {}
+    missing_symbols = []
+    for symbol in symbols:
+        cached = STOCK_CACHE.get(symbol, period)
+        if cached is None:
+            missing_symbols.append(symbol)
+        else:
+            all_data[symbol] = cached
+    
+    if not missing_symbols:
+        return all_data
+    
+    data = yf.download(" ".join(missing_symbols), period=period, group_by="ticker", threads=True, progress=False)
+    
+    for symbol in missing_symbols:
+        if symbol in data.columns.get_level_values(0):
+            # 使用するのは終値のみなので、それ以外の列はここで落とす
+            # (表示は小数2桁までなのでfloat32で十分な精度がある)
+            symbol_data = data[symbol][['Close']].dropna().astype('float32')
+            if not symbol_data.empty:
+                all_data[symbol] = symbol_data
+                STOCK_CACHE.set(symbol, period, symbol_data)
+    return all_data
+
+@st.cache_resource  # セッションやCookieを保持したまま使い回す
+def _ticker(symbol: str) -> yfc.Ticker:
+    """
+    指定された銘柄のTickerオブジェクトを取得
+    
+    Parameters:
+        symbol: 銘柄コード (例: "7203.T")
+    
+    Returns:
+        yfinance-cacheのTickerオブジェクト
+    """
+    return yfc.Ticker(symbol)
+
+@st.cache_data(ttl=3600)  # メモリ上に1時間キャッシュ（ネットワークからの再取得はファイルキャッシュにより最大24時間ごと）
 def get_stock_data(symbol: str, period: str = "1y") -> pd.DataFrame:
     """
     指定された銘柄の株価データを取得
     
+    全銘柄の一括取得結果から該当銘柄を切り出し、一括取得に含まれなかった
+    場合のみ個別に取得する
+    
     Parameters:
         symbol: 銘柄コード (例: "7203.T")
         period: 取得期間 (デフォルト: "1y")
     
     Returns:
-        株価データを含むDataFrame (Date, Open, High, Low, Close, Volume)
+        終値を含むDataFrame (Date, Close)
     
     Raises:
         Exception: データ取得に失敗した場合
     """
     try:
-        # yfinanceを使用してデータを取得
-        ticker = yf.Ticker(symbol)
-        data = ticker.history(period=period)
+        # 全銘柄の一括取得結果から該当銘柄を切り出す
+        data = get_all_stock_data(tuple(NAME_BY_CODE), period).get(symbol)
+        
+        fetched_individually = data is None or data.empty
+        if fetched_individually:
+            # yfinance-cacheを使用して個別に取得（未取得の取引日のみダウンロード）
+            ticker = _ticker(symbol)
+            data = ticker.history(period=period)
         
         # データが空でないことを確認
         if data.empty:
             raise ValueError(f"銘柄コード {symbol} のデータを取得できませんでした。銘柄コードが正しいか、またはインターネット接続を確認してください。")
         
+        # 使用するのは終値のみなので、それ以外の列は落としてfloat32で保持する
+        data = data[['Close']].astype('float32', copy=False)
+        
         # データポイントが十分にあるか確認
         if len(data) < 25:
             raise ValueError(f"取得したデータが不十分です（{len(data)}日分）。移動平均の計算には最低25日分のデータが必要です。")
         
+        # 個別に取得したデータもファイルキャッシュに保存し、再起動後は一括取得時にキャッシュから読み込む
+        if fetched_individually:
+            STOCK_CACHE.set(symbol, period, data)
+        
         return data
     
     except ValueError as ve:
@@ -81,7 +246,9 @@ def calculate_moving_average(data: pd.DataFrame, window: int = 25) -> pd.Series:
     if 'Close' not in data.columns:
         raise ValueError("株価データに'Close'カラムが存在しません。")
     
-    return data['Close'].rolling(window=window).mean()
+    # 累積和を1回走査するだけのカーネル(bottleneck/numbagg)で計算（pandasのrollingより高速）
+    close = data['Close'].to_numpy(dtype=float)
+    return pd.Series(move_mean(close, window=window, min_count=window), index=data.index)
 
 def calculate_purchase_cost(current_price: float, shares: int = 100) -> float:
     """
@@ -125,37 +292,57 @@ def determine_trend(current_price: float, moving_average: float) -> str:
     else:
         return "下降"
 
-def main():
-    """メインアプリケーション"""
-    # ページ設定でレイアウトをワイドに
-    st.set_page_config(page_title="株式投資分析", layout="wide")
+@st.cache_data(ttl=3600)  # 株価データと同じ期間キャッシュ
+def analyze_symbol(symbol: str) -> dict | None:
+    """
+    指定された銘柄の現在値・購入判定・トレンドをまとめて算出
     
-    st.title("📊 株式投資分析")
+    Parameters:
+        symbol: 銘柄コード (例: "7203.T")
     
-    # サイドバー: 銘柄選択
-    st.sidebar.header("銘柄選択")
+    Returns:
+        current_price, current_ma, purchase_cost, is_affordable, trend を含む辞書
+        株価が無効な値の場合はNone
     
-    # 銘柄リストをカテゴリ別に分ける
-    affordable_symbols = {
-        "1301.T": "極洋",
-        "4004.T": "昭和電工",
-        "7270.T": "富士通テン",
-        "9439.T": "東京通信グループ",
-        "8410.T": "セブン銀行",
-        "9434.T": "ソフトバンク"
+    Raises:
+        Exception: データ取得に失敗した場合
+    """
+    stock_data = get_stock_data(symbol)
+    
+    # 現在の株価と直近25日の移動平均を取得（判定には最新値のみ必要）
+    # pandasのインデックス処理を経由せずnumpy配列から直接取り出す
+    close = stock_data['Close'].to_numpy()
+    current_price = float(close[-1])
+    current_ma = float(close[-25:].mean(dtype=float))
+    
+    # 株価が有効な値かチェック
+    if math.isnan(current_price) or current_price <= 0 or math.isnan(current_ma):
+        return None
+    
+    # 購入コストとトレンドを計算
+    purchase_cost = calculate_purchase_cost(current_price, shares=100)
+    
+    return {
+        "current_price": current_price,
+        "current_ma": current_ma,
+        "purchase_cost": purchase_cost,
+        "is_affordable": determine_affordability(purchase_cost, budget=50000),
+        "trend": determine_trend(current_price, current_ma)
     }
+
+def _render_sidebar() -> str:
+    """
+    サイドバー（銘柄選択と使い方ガイド）を表示
     
-    premium_symbols = {
-        "7203.T": "トヨタ自動車",
-        "8306.T": "三菱UFJフィナンシャル・グループ",
-        "9984.T": "ソフトバンクグループ",
-        "6758.T": "ソニーグループ",
-        "9433.T": "KDDI"
-    }
+    Returns:
+        選択された銘柄コード
+    """
+    # サイドバー: 銘柄選択
+    st.sidebar.header("銘柄選択")
     
     # セッション状態の初期化
     if 'selected_symbol' not in st.session_state:
-        st.session_state.selected_symbol = list(affordable_symbols.keys())[0]
+        st.session_state.selected_symbol = OPTIONS_BY_CATEGORY["affordable"][0][1]
     if 'category' not in st.session_state:
         st.session_state.category = "affordable"
     
@@ -169,170 +356,165 @@ def main():
     # カテゴリに応じて銘柄リストを切り替え
     if category == "✅ 50,000円以下":
         st.session_state.category = "affordable"
-        current_symbols = affordable_symbols
     else:
         st.session_state.category = "premium"
-        current_symbols = premium_symbols
     
-    # 選択されたカテゴリの銘柄オプションを作成
-    stock_options = {f"{code}: {name}": code for code, name in current_symbols.items()}
+    # 選択されたカテゴリの銘柄オプションを取得
+    options = OPTIONS_BY_CATEGORY[st.session_state.category]
     
-    # 現在の選択が現在のカテゴリに存在するか確認
-    if st.session_state.selected_symbol not in current_symbols:
-        st.session_state.selected_symbol = list(current_symbols.keys())[0]
+    # 現在の選択がカテゴリに存在しない場合は先頭の銘柄を選択
+    selected_index = INDEX_BY_SYMBOL[st.session_state.category].get(st.session_state.selected_symbol, 0)
     
     # ドロップダウンで銘柄を選択
     selected_option = st.sidebar.selectbox(
         "銘柄を選択",
-        options=list(stock_options.keys()),
-        index=list(stock_options.values()).index(st.session_state.selected_symbol)
+        options=options,
+        index=selected_index,
+        format_func=lambda option: option[0]
     )
     
     # 選択された銘柄コードをセッション状態に保存
-    st.session_state.selected_symbol = stock_options[selected_option]
-    
-    # 選択された銘柄の会社名を取得
-    selected_company_name = STOCK_SYMBOLS[st.session_state.selected_symbol]
+    st.session_state.selected_symbol = selected_option[1]
     
     # サイドバー: 使い方ガイド
     st.sidebar.markdown("---")
     st.sidebar.header("📖 使い方")
     
-    with st.sidebar.expander("このアプリについて"):
-        st.markdown("""
-        日本株の分析と少額投資（5万円以下）の判断をサポートします。
+    # 使い方ガイドの各項目を折りたたみ表示
+    for title, body in HELP_SECTIONS:
+        with st.sidebar.expander(title):
+            st.markdown(body)
+    
+    return st.session_state.selected_symbol
+
+def _render_header(symbol: str) -> None:
+    """
+    選択された銘柄の見出しを表示
+    
+    Parameters:
+        symbol: 銘柄コード (例: "7203.T")
+    """
+    # ヘッダー情報を1行で表示
+    st.markdown(f"### {NAME_BY_CODE[symbol]} ({symbol})")
+
+def _load_analysis(symbol: str) -> tuple[dict, pd.DataFrame]:
+    """
+    分析結果とチャート用データを取得
+    
+    前回と同じ銘柄で1時間以内に表示済みなら、セッション状態に保存済みの結果を返す
+    (1時間を過ぎて再計算しても、株価はファイルキャッシュから読み込むため
+    最大24時間前のデータの場合がある)
+    
+    Parameters:
+        symbol: 銘柄コード (例: "7203.T")
+    
+    Returns:
+        analyze_symbolの結果の辞書と、株価・25日移動平均のDataFrame
+    
+    Raises:
+        Exception: データ取得に失敗した場合
+    """
+    # サイドバーの操作だけによる再実行ではデータ取得・計算を行わない
+    # (1時間ごとの再計算はキャッシュ済みの関数を呼び直すだけで、株価の鮮度は変わらない)
+    if (st.session_state.get('last_rendered_symbol') == symbol
+            and time.time() - st.session_state.get('last_rendered_at', 0) < 3600):
+        return st.session_state.last_info, st.session_state.last_chart
+    
+    # 株価データを取得
+    with st.spinner(f"{NAME_BY_CODE[symbol]}のデータを取得中..."):
+        stock_data = get_stock_data(symbol)
+        # 現在値・購入判定・トレンドを取得（銘柄ごとにキャッシュ済み）
+        info = analyze_symbol(symbol)
+    
+    # データ取得成功を確認
+    if stock_data is None or stock_data.empty:
+        st.error("❌ データ取得失敗")
+        st.stop()
+    
+    # 株価が有効な値かチェック
+    if info is None:
+        st.warning("⚠️ データが無効です")
+        st.stop()
+    
+    # チャート用に25日移動平均の系列を計算
+    ma_series = calculate_moving_average(stock_data, window=25)
+    
+    # チャート用のデータを準備（各列をコピーせずに参照する）
+    chart_data = pd.DataFrame({
+        '株価': stock_data['Close'],
+        '25日移動平均': ma_series
+    }, copy=False)
+    
+    # 次回以降の再実行で再利用できるようセッション状態に保存
+    st.session_state.last_info = info
+    st.session_state.last_chart = chart_data
+    st.session_state.last_rendered_symbol = symbol
+    st.session_state.last_rendered_at = time.time()
+    
+    return info, chart_data
+
+def _render_body(info: dict, chart_data: pd.DataFrame) -> None:
+    """
+    チャートと分析情報を2カラムで表示
+    
+    Parameters:
+        info: analyze_symbolの結果の辞書
+        chart_data: 株価・25日移動平均のDataFrame
+    """
+    # 2カラムレイアウト: 左側にチャート、右側に分析情報
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # チャートを表示（高さを制限）
+        st.line_chart(chart_data, height=400)
+        # 期間の開始日と終了日をまとめて書式化
+        start_date, end_date = chart_data.index[[0, -1]].strftime('%Y/%m/%d')
+        st.caption(f"{start_date} ～ {end_date}")
+    
+    with col2:
+        # 現在の株価
+        st.metric("現在の株価", f"¥{info['current_price']:,.2f}")
         
-        **機能:**
-        - 過去1年間の株価チャート
-        - 25日移動平均線
-        - 100株購入の可否判定
-        - トレンド分析
-        """)
-    
-    with st.sidebar.expander("画面の見方"):
-        st.markdown("""
-        **チャート（左側）**
-        - 青線：株価の推移
-        - オレンジ線：25日移動平均
+        # 購入判定
+        st.markdown("#### 💰 購入判定")
+        st.metric("100株購入", f"¥{info['purchase_cost']:,.0f}")
         
-        **分析情報（右側）**
-        - 💰 購入判定：100株の金額
-        - ✅/❌：50,000円以下か
-        - 📈 トレンド：上昇/下降
-        """)
-    
-    with st.sidebar.expander("判定の見方"):
-        st.markdown("""
-        **購入判定**
-        - ✅ 購入可能：50,000円以下
-        - ❌ 予算超過：50,000円超
+        if info["is_affordable"]:
+            st.success("✅ 購入可能")
+            st.metric("判定", "50,000円以下")
+        else:
+            st.warning("❌ 予算超過")
+            st.metric("判定", "50,000円超")
         
-        **トレンド**
-        - ↗ 上昇：株価 > 移動平均
-        - ↘ 下降：株価 < 移動平均
-        """)
-    
-    with st.sidebar.expander("対応銘柄"):
-        st.markdown("""
-        **5万円以下で購入可能**
-        - 極洋、昭和電工
-        - 富士通テン
-        - 東京通信グループ
-        - セブン銀行
-        - ソフトバンク
+        # トレンド分析
+        st.markdown("#### 📈 トレンド")
         
-        **主要銘柄（50,000円超）**
-        - トヨタ、三菱UFJ
-        - ソフトバンクG、ソニーG
-        - KDDI
-        """)
-    
-    with st.sidebar.expander("⚠️ 免責事項"):
-        st.markdown("""
-        **重要な注意事項**
+        if info["trend"] == "上昇":
+            st.success("上昇トレンド")
+            st.metric("トレンド", "↗ 上昇")
+        else:
+            st.info("下降トレンド")
+            st.metric("トレンド", "↘ 下降")
         
-        - このアプリは情報提供のみを目的としています
-        - 投資助言や推奨ではありません
-        - 実際の投資判断は自己責任で行ってください
-        - 過去のデータは将来の結果を保証しません
-        - 投資にはリスクが伴います
-        - データの正確性を保証するものではありません
-        - 金融商品取引業の登録はありません
-        """)
+        st.caption(f"株価: ¥{info['current_price']:,.2f}")
+        st.caption(f"25日MA: ¥{info['current_ma']:,.2f}")
+
+def main():
+    """メインアプリケーション"""
+    # ページ設定でレイアウトをワイドに
+    st.set_page_config(page_title="株式投資分析", layout="wide")
+    
+    st.title("📊 株式投資分析")
+    
+    # データ取得より先にサイドバーと見出しを表示する
+    symbol = _render_sidebar()
+    _render_header(symbol)
     
     # メインエリア: 2カラムレイアウト
     try:
-        # 株価データを取得
-        with st.spinner(f"{selected_company_name}のデータを取得中..."):
-            stock_data = get_stock_data(st.session_state.selected_symbol)
-        
-        # データ取得成功を確認
-        if stock_data is None or stock_data.empty:
-            st.error("❌ データ取得失敗")
-            st.stop()
-        
-        # 25日移動平均を計算
-        stock_data['MA_25'] = calculate_moving_average(stock_data, window=25)
-        
-        # 現在の株価と移動平均を取得
-        current_price = stock_data['Close'].iloc[-1]
-        current_ma = stock_data['MA_25'].iloc[-1]
-        
-        # 株価が有効な値かチェック
-        if pd.isna(current_price) or current_price <= 0 or pd.isna(current_ma):
-            st.warning("⚠️ データが無効です")
-            st.stop()
-        
-        # 購入コストとトレンドを計算
-        purchase_cost = calculate_purchase_cost(current_price, shares=100)
-        is_affordable = determine_affordability(purchase_cost, budget=50000)
-        trend = determine_trend(current_price, current_ma)
-        
-        # ヘッダー情報を1行で表示
-        st.markdown(f"### {selected_company_name} ({st.session_state.selected_symbol})")
-        
-        # 2カラムレイアウト: 左側にチャート、右側に分析情報
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            # チャート用のデータを準備
-            chart_data = pd.DataFrame({
-                '株価': stock_data['Close'],
-                '25日移動平均': stock_data['MA_25']
-            })
-            
-            # チャートを表示（高さを制限）
-            st.line_chart(chart_data, height=400)
-            st.caption(f"{stock_data.index[0].strftime('%Y/%m/%d')} ～ {stock_data.index[-1].strftime('%Y/%m/%d')}")
-        
-        with col2:
-            # 現在の株価
-            st.metric("現在の株価", f"¥{current_price:,.2f}")
-            
-            # 購入判定
-            st.markdown("#### 💰 購入判定")
-            st.metric("100株購入", f"¥{purchase_cost:,.0f}")
-            
-            if is_affordable:
-                st.success("✅ 購入可能")
-                st.markdown("<p style='text-align: center; font-size: 24px; color: green; font-weight: bold;'>50,000円以下</p>", unsafe_allow_html=True)
-            else:
-                st.warning("❌ 予算超過")
-                st.markdown("<p style='text-align: center; font-size: 24px; color: orange; font-weight: bold;'>50,000円超</p>", unsafe_allow_html=True)
-            
-            # トレンド分析
-            st.markdown("#### 📈 トレンド")
-            
-            if trend == "上昇":
-                st.success("上昇トレンド")
-                st.markdown("<p style='text-align: center; font-size: 28px; color: green; font-weight: bold;'>↗ 上昇</p>", unsafe_allow_html=True)
-            else:
-                st.info("下降トレンド")
-                st.markdown("<p style='text-align: center; font-size: 28px; color: blue; font-weight: bold;'>↘ 下降</p>", unsafe_allow_html=True)
-            
-            st.caption(f"株価: ¥{current_price:,.2f}")
-            st.caption(f"25日MA: ¥{current_ma:,.2f}")
-        
+        info, chart_data = _load_analysis(symbol)
+        _render_body(info, chart_data)
+    
     except ValueError as ve:
         st.error(f"❌ {str(ve)}")
     except Exception as e:
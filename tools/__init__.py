@@ -0,0 +1,3 @@
+"""
+株式投資分析アプリケーションの補助ツール
+"""
@@ -0,0 +1,86 @@
+"""
+株価データのファイルキャッシュ
+アプリの再起動やセッションをまたいでyfinanceの取得結果を再利用する
+"""
+
+import json
+import time
+from pathlib import Path
+
+import pandas as pd
+
+class FileCache:
+    """
+    (銘柄コード, 取得期間) をキーに株価データをディスクへ保存するキャッシュ
+    
+    データ本体は "{symbol}_{period}.parquet"、取得時刻は同名の ".meta.json" に保存する
+    """
+    
+    def __init__(self, cache_dir: str = ".cache", ttl_seconds: int = 86400):
+        """
+        Parameters:
+            cache_dir: キャッシュファイルの保存先ディレクトリ
+            ttl_seconds: キャッシュの有効期間（秒、デフォルト: 24時間）
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+    
+    def _paths(self, symbol: str, period: str) -> tuple[Path, Path]:
+        """データファイルとメタデータファイルのパスを返す"""
+        stem = f"{symbol}_{period}"
+        return self.cache_dir / f"{stem}.parquet", self.cache_dir / f"{stem}.meta.json"
+    
+    def get(self, symbol: str, period: str) -> pd.DataFrame | None:
+        """
+        有効期間内のキャッシュを取得
+        
+        Parameters:
+            symbol: 銘柄コード (例: "7203.T")
+            period: 取得期間 (例: "1y")
+        
+        Returns:
+            キャッシュされたDataFrame。存在しないか期限切れの場合はNone
+        """
+        data_path, meta_path = self._paths(symbol, period)
+        
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        
+        # JSONとしては正しくても形式が想定と異なれば壊れているものとして扱う
+        if not isinstance(meta, dict):
+            return None
+        fetched_at = meta.get("fetched_at")
+        if isinstance(fetched_at, bool) or not isinstance(fetched_at, (int, float)):
+            return None
+        
+        # 有効期間を過ぎたキャッシュは使わない
+        if time.time() - fetched_at > self.ttl_seconds:
+            return None
+        
+        try:
+            return pd.read_parquet(data_path)
+        except (OSError, ValueError):
+            # ファイルが壊れている場合は再取得させる
+            return None
+    
+    def set(self, symbol: str, period: str, data: pd.DataFrame) -> None:
+        """
+        株価データをキャッシュに保存
+        
+        Parameters:
+            symbol: 銘柄コード (例: "7203.T")
+            period: 取得期間 (例: "1y")
+            data: 保存する株価データ
+        """
+        data_path, meta_path = self._paths(symbol, period)
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            data.to_parquet(data_path)
+            # データ本体の書き込み完了後に取得時刻を記録する
+            meta_path.write_text(json.dumps({"fetched_at": time.time()}), encoding="utf-8")
+        except OSError:
+            # 保存に失敗してもデータ取得自体は成功しているので無視する
+            pass
@@ -0,0 +1,97 @@
+"""
+FileCacheのテスト
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from tools import cache as cache_module
+from tools.cache import FileCache
+
+@pytest.fixture
+def stock_data() -> pd.DataFrame:
+    """tz付きの日付インデックスとfloat32の終値を持つ株価データ"""
+    index = pd.date_range("2024-01-04", periods=30, freq="B", tz="Asia/Tokyo", name="Date")
+    return pd.DataFrame({"Close": [1000.5 + i for i in range(30)]}, index=index).astype("float32")
+
+@pytest.fixture
+def now(monkeypatch) -> list[float]:
+    """time.timeを固定し、リストの値を書き換えることで時刻を進められるようにする"""
+    current = [1_700_000_000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: current[0])
+    return current
+
+def test_set_get_round_trip(tmp_path, stock_data, now):
+    cache = FileCache(tmp_path, ttl_seconds=60)
+    cache.set("7203.T", "1y", stock_data)
+    
+    cached = cache.get("7203.T", "1y")
+    
+    pd.testing.assert_frame_equal(cached, stock_data, check_freq=False)
+    assert str(cached.index.tz) == "Asia/Tokyo"
+    assert cached["Close"].dtype == "float32"
+
+def test_get_missing_returns_none(tmp_path, now):
+    assert FileCache(tmp_path).get("7203.T", "1y") is None
+
+def test_get_after_ttl_returns_none(tmp_path, stock_data, now):
+    cache = FileCache(tmp_path, ttl_seconds=60)
+    cache.set("7203.T", "1y", stock_data)
+    
+    now[0] += 60
+    assert cache.get("7203.T", "1y") is not None
+    
+    now[0] += 1
+    assert cache.get("7203.T", "1y") is None
+
+def test_keys_include_period(tmp_path, stock_data, now):
+    cache = FileCache(tmp_path)
+    cache.set("7203.T", "1y", stock_data)
+    
+    assert cache.get("7203.T", "6mo") is None
+    assert cache.get("6758.T", "1y") is None
+
+@pytest.mark.parametrize("meta_text", [
+    "{not json",
+    "[1, 2, 3]",
+    "null",
+    '"text"',
+    "{}",
+    '{"fetched_at": "x"}',
+    '{"fetched_at": null}',
+    '{"fetched_at": true}'
+])
+def test_corrupt_meta_returns_none(tmp_path, stock_data, now, meta_text):
+    cache = FileCache(tmp_path)
+    cache.set("7203.T", "1y", stock_data)
+    (tmp_path / "7203.T_1y.meta.json").write_text(meta_text, encoding="utf-8")
+    
+    assert cache.get("7203.T", "1y") is None
+
+def test_corrupt_parquet_returns_none(tmp_path, stock_data, now):
+    cache = FileCache(tmp_path)
+    cache.set("7203.T", "1y", stock_data)
+    (tmp_path / "7203.T_1y.parquet").write_bytes(b"not a parquet file")
+    
+    assert cache.get("7203.T", "1y") is None
+
+def test_meta_written_after_data(tmp_path, stock_data, now, monkeypatch):
+    def fail_to_parquet(self, path, *args, **kwargs):
+        raise OSError("disk full")
+    monkeypatch.setattr(pd.DataFrame, "to_parquet", fail_to_parquet)
+    
+    cache = FileCache(tmp_path)
+    # 書き込みに失敗しても例外は送出しない
+    cache.set("7203.T", "1y", stock_data)
+    
+    assert not (tmp_path / "7203.T_1y.meta.json").exists()
+    assert cache.get("7203.T", "1y") is None
+
+def test_set_creates_cache_dir(tmp_path, stock_data, now):
+    cache_dir = tmp_path / "nested" / ".cache"
+    FileCache(cache_dir).set("7203.T", "1y", stock_data)
+    
+    meta = json.loads((cache_dir / "7203.T_1y.meta.json").read_text(encoding="utf-8"))
+    assert meta == {"fetched_at": now[0]}